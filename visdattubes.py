@@ -1,9 +1,26 @@
+import datetime
 import streamlit as st
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 
+# Serialize figures with orjson instead of the stdlib json encoder
+pio.json.config.default_engine = "orjson"
+
+# Shared dark styling applied to every chart
+CHART_LAYOUT = dict(
+    plot_bgcolor='#334155',
+    paper_bgcolor='#334155',
+    font=dict(color='#F1F5F9', size=12),
+    title_font=dict(size=16, color='#F1F5F9'),
+    yaxis=dict(gridcolor='#64748B', tickformat='$,.0f')
+)
+
 st.set_page_config(layout="wide", page_title="Coffee Shop Sales Analysis")
 
 st.markdown("""
@@ -63,20 +80,25 @@ def load_data(uploaded_file):
     try:
         if uploaded_file.name.endswith('.xlsx'):
             # For Excel files, try to load "Transactions" sheet first
-            excel_file = pd.ExcelFile(uploaded_file)
+            # Prefer the Rust-backed calamine reader, falling back to openpyxl
+            try:
+                excel_file = pd.ExcelFile(uploaded_file, engine="calamine")
+            except ImportError:
+                excel_file = pd.ExcelFile(uploaded_file, engine="openpyxl")
             st.info(f"Available sheets: {excel_file.sheet_names}")
             
             # Check if "Transactions" sheet exists
             if "Transactions" in excel_file.sheet_names:
-                data = pd.read_excel(uploaded_file, sheet_name="Transactions")
+                data = excel_file.parse(sheet_name="Transactions", dtype_backend="pyarrow")
                 st.success("Data loaded successfully from Transactions sheet!")
             else:
                 # Load the first sheet if Transactions doesn't exist
-                data = pd.read_excel(uploaded_file, sheet_name=excel_file.sheet_names[0])
+                data = excel_file.parse(sheet_name=excel_file.sheet_names[0], dtype_backend="pyarrow")
                 st.success(f"Data loaded successfully from {excel_file.sheet_names[0]} sheet!")
         
         elif uploaded_file.name.endswith('.csv'):
-            data = pd.read_csv(uploaded_file)
+            # Multithreaded Arrow parser, keeping columns Arrow-backed
+            data = pd.read_csv(uploaded_file, engine="pyarrow", dtype_backend="pyarrow")
             st.success("CSV data loaded successfully!")
         
         else:
@@ -91,157 +113,204 @@ def load_data(uploaded_file):
         st.error(f"Error loading file: {e}")
         return pd.DataFrame()
 
-# File uploader
-uploaded_file = st.file_uploader(
-    "Upload your Coffee Shop Sales data",
-    type=['xlsx', 'csv'],
-    help="Upload an Excel file (.xlsx) or CSV file (.csv) containing coffee shop sales data"
-)
+# --- Data Preprocessing (cached so widget reruns skip all parsing work) ---
+@st.cache_data(show_spinner=False)
+def preprocess(df, date_col, time_col, location_col, category_col, bill_col):
+    data = df.copy()
 
-# Load data if file is uploaded
-if uploaded_file is not None:
-    data = load_data(uploaded_file)
-else:
-    st.info("👆 Please upload a data file to get started")
-    data = pd.DataFrame()
+    # Convert date column
+    if date_col in data.columns:
+        data['transaction_date'] = pd.to_datetime(data[date_col], dayfirst=True, errors='coerce')
+        data['weekday'] = data['transaction_date'].dt.day_name()
+    else:
+        st.error(f"Date column '{date_col}' not found in data")
+        st.stop()
 
-# Only proceed if data was loaded successfully and is not empty
-if not data.empty:
-    # Display first few rows to understand the data structure
-    with st.expander("📊 Data Preview", expanded=False):
-        st.write(data.head())
-    
-    # --- Data Preprocessing with better error handling ---
-    try:
-        # Find relevant columns
-        date_cols = [col for col in data.columns if 'date' in col.lower()]
-        time_cols = [col for col in data.columns if 'time' in col.lower()]
-        location_cols = [col for col in data.columns if 'location' in col.lower() or 'store' in col.lower()]
-        category_cols = [col for col in data.columns if 'category' in col.lower() or 'product' in col.lower()]
-        amount_cols = [col for col in data.columns if 'bill' in col.lower() or 'total' in col.lower() or 'amount' in col.lower() or 'price' in col.lower()]
-        
-        with st.expander("🔍 Column Detection", expanded=False):
-            st.write("Detected columns:")
-            st.write(f"📅 Date columns: {date_cols}")
-            st.write(f"⏰ Time columns: {time_cols}")
-            st.write(f"📍 Location columns: {location_cols}")
-            st.write(f"🏷️ Category columns: {category_cols}")
-            st.write(f"💰 Amount columns: {amount_cols}")
-        
-        # Use detected columns or fallback to defaults
-        date_col = date_cols[0] if date_cols else data.columns[0]
-        time_col = time_cols[0] if time_cols else (data.columns[1] if len(data.columns) > 1 else data.columns[0])
-        location_col = location_cols[0] if location_cols else (data.columns[2] if len(data.columns) > 2 else data.columns[0])
-        category_col = category_cols[0] if category_cols else (data.columns[3] if len(data.columns) > 3 else data.columns[0])
-        bill_col = amount_cols[0] if amount_cols else data.columns[-1]
-        
-        st.success(f"✅ Using columns - Date: **{date_col}**, Time: **{time_col}**, Location: **{location_col}**, Category: **{category_col}**, Amount: **{bill_col}**")
-        
-        # Convert date column
-        if date_col in data.columns:
-            data['transaction_date'] = pd.to_datetime(data[date_col], dayfirst=True, errors='coerce')
-            data['weekday'] = data['transaction_date'].dt.day_name()
-        else:
-            st.error(f"Date column '{date_col}' not found in data")
-            st.stop()
-        
-        # Extract hour from time column
-        if time_col in data.columns:
-            data['Hour'] = data[time_col].apply(lambda x: int(str(x).split(':')[0]) if pd.notna(x) and ':' in str(x) else 12)
+    # Extract hour from time column
+    if time_col in data.columns:
+        times = data[time_col]
+        first_time = times.dropna().iloc[0] if times.notna().any() else None
+        if pd.api.types.is_datetime64_any_dtype(times):
+            hours = times.dt.hour
+        elif isinstance(times.dtype, pd.ArrowDtype) and pa.types.is_time(times.dtype.pyarrow_dtype):
+            hours = pd.Series(pc.hour(pa.array(times)), index=times.index, dtype=pd.ArrowDtype(pa.int64()))
+        elif isinstance(first_time, datetime.time):
+            hours = times.map(lambda t: t.hour, na_action='ignore')
         else:
-            st.warning(f"Time column '{time_col}' not found, using default hour 12")
-            data['Hour'] = 12
-        
-        # Correcting anomaly if the amount column exists
-        if bill_col in data.columns:
-            data.loc[data[bill_col] == 360, bill_col] = 36
-        
-        # Create Day Name and Month Name
-        data['Day Name'] = data['weekday']
-        data['Month Name'] = data['transaction_date'].dt.month_name()
+            # Leading "H:" or "HH:" of "HH:MM", "HH:MM:SS" or "HH:MM:SS.ffffff" strings
+            hours = pd.to_numeric(times.astype(str).str.extract(r'^\s*(\d{1,2}):', expand=False), errors='coerce')
+        data['Hour'] = hours.fillna(12).astype('int8')
+    else:
+        st.warning(f"Time column '{time_col}' not found, using default hour 12")
+        data['Hour'] = 12
 
-        weekly_order = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-        data["Day Name"] = pd.Categorical(data["Day Name"], categories=weekly_order, ordered=True)
+    # Create Day Name and Month Name
+    data['Day Name'] = data['weekday']
+    data['Month Name'] = data['transaction_date'].dt.month_name()
 
-        month_order = ["January", "February", "March", "April", "May", "June"]
-        data["Month Name"] = pd.Categorical(data["Month Name"], categories=month_order, ordered=True)
+    weekly_order = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+    data["Day Name"] = pd.Categorical(data["Day Name"], categories=weekly_order, ordered=True)
 
-    except Exception as e:
-        st.error(f"Error in data preprocessing: {e}")
-        with st.expander("🐛 Debug Information", expanded=True):
-            st.write("Data types:")
-            st.write(data.dtypes)
-            st.write("Sample of data:")
-            st.write(data.head())
-        st.stop()
+    month_order = ["January", "February", "March", "April", "May", "June"]
+    data["Month Name"] = pd.Categorical(data["Month Name"], categories=month_order, ordered=True)
 
-    # --- Streamlit Widgets for Filters ---
-    st.sidebar.header("🎛️ Dashboard Filters")
-    
-    selected_location = st.sidebar.selectbox(
-        "📍 Filter by Store Location:",
-        options=['All Locations'] + sorted(data[location_col].unique().tolist())
-    )
-    selected_hour = st.sidebar.slider(
-        "⏰ Filter by Hour of the Day:",
-        min_value=int(data['Hour'].min()),
-        max_value=int(data['Hour'].max()),
-        value=12,
-        step=1
-    )
-    selected_category = st.sidebar.selectbox(
-        "🏷️ Filter by Product Category:",
-        options=['All Categories'] + sorted(data[category_col].unique().tolist())
+    # Downcast to compact dtypes: smaller frame and integer-coded groupby keys
+    data['weekday'] = data['weekday'].astype('category')
+    for col in (location_col, category_col):
+        data[col] = data[col].astype('category')
+    if bill_col in data.columns:
+        data[bill_col] = pd.to_numeric(data[bill_col], downcast='float')
+
+        # Correcting anomaly (360 entered instead of 36) in a single array pass
+        bills = data[bill_col].to_numpy()
+        data[bill_col] = np.where(bills == 360, 36, bills)
+
+    return data
+
+# --- Revenue cube: one aggregation reused by every widget combination ---
+@st.cache_data(show_spinner=False)
+def build_cube(df, location_col, category_col, bill_col):
+    return df.groupby([location_col, category_col, 'Hour', 'transaction_date'], observed=True, sort=False, dropna=False)[bill_col].sum()
+
+def level_mask(index, level, value):
+    # Compare integer level codes rather than materializing the level values
+    level_pos = index.names.index(level)
+    code = index.levels[level_pos].get_indexer([value])[0]
+    if code == -1:
+        return np.zeros(len(index), dtype=bool)
+    return index.codes[level_pos] == code
+
+def filter_options(df, col, all_label):
+    # Categorical columns already hold their unique values, so no scan of the rows
+    return [all_label] + sorted(df[col].cat.categories.tolist())
+
+def top_with_other(sales, label_col, bill_col, n=15):
+    # Keep the n largest bars (sales is sorted descending) and fold the rest into "Other".
+    # Labels become strings so numeric ids (store_id, product_id) share an axis with it
+    sales = sales.assign(**{label_col: sales[label_col].astype(str)})
+    if len(sales) <= n:
+        return sales
+    top = sales.head(n)
+    other_label = 'Other'
+    if other_label in top[label_col].values:
+        other_label = f'Other ({len(sales) - n} more)'
+    other = pd.DataFrame({label_col: [other_label], bill_col: [sales[bill_col].iloc[n:].sum()]})
+    return pd.concat([top, other], ignore_index=True)
+
+# --- Summary statistics: independent of the filters, so computed once ---
+@st.cache_data(show_spinner=False)
+def summary(df, bill_col):
+    bills = df[bill_col].astype('float64')
+    return dict(
+        total=bills.sum(),
+        count=len(df),
+        mean=bills.mean(),
+        dmin=df['transaction_date'].min(),
+        dmax=df['transaction_date'].max()
     )
 
+@st.cache_data(show_spinner=False)
+def to_csv(df):
+    return df.to_csv(index=False).encode('utf-8')
+
+# --- Filters and charts: reruns on its own when a filter widget changes ---
+@st.fragment
+def render_dashboard(data, cube, location_col, category_col, bill_col):
+    # --- Streamlit Widgets for Filters ---
+    # Kept inside the fragment body (fragments cannot write to the sidebar) so a
+    # filter change only reruns this section
+    st.subheader("🎛️ Dashboard Filters")
+
+    filter_col1, filter_col2 = st.columns(2)
+    with filter_col1:
+        selected_location = st.selectbox(
+            "📍 Filter by Store Location:",
+            options=filter_options(data, location_col, 'All Locations')
+        )
+    with filter_col2:
+        selected_category = st.selectbox(
+            "🏷️ Filter by Product Category:",
+            options=filter_options(data, category_col, 'All Categories')
+        )
+
     # --- Filtering Logic based on Streamlit Widgets ---
-    # Filter for Daily Revenue Plot
-    filtered_daily_data = data.copy()
+    # Widget changes slice the cached revenue cube instead of rescanning the data
+
+    # Filter for Daily Revenue Plot (every hour is kept; the hour is picked in the browser)
+    daily_mask = np.ones(len(cube), dtype=bool)
     if selected_location != "All Locations":
-        filtered_daily_data = filtered_daily_data[filtered_daily_data[location_col] == selected_location]
-    filtered_daily_data = filtered_daily_data[filtered_daily_data['Hour'] == selected_hour]
+        daily_mask &= level_mask(cube.index, location_col, selected_location)
+    filtered_daily_data = cube[daily_mask]
 
-    # Group by date and sum bill for the line plot
-    daily_sums = filtered_daily_data.groupby('transaction_date')[bill_col].sum().reset_index()
+    # Group by hour and date and sum bill for the line plot (skipped when nothing matches)
+    if len(filtered_daily_data):
+        daily_sums = filtered_daily_data.groupby(level=['Hour', 'transaction_date']).sum().reset_index()
+    else:
+        daily_sums = pd.DataFrame({'Hour': [], 'transaction_date': [], bill_col: []})
 
     # Filter for Bar Charts
-    filtered_bar_data = data.copy()
+    bar_mask = np.ones(len(cube), dtype=bool)
     if selected_location != "All Locations":
-        filtered_bar_data = filtered_bar_data[filtered_bar_data[location_col] == selected_location]
+        bar_mask &= level_mask(cube.index, location_col, selected_location)
     if selected_category != "All Categories":
-        filtered_bar_data = filtered_bar_data[filtered_bar_data[category_col] == selected_category]
+        bar_mask &= level_mask(cube.index, category_col, selected_category)
+    filtered_bar_data = cube[bar_mask]
 
     # Group for Location Plot
-    current_location_sales = filtered_bar_data.groupby(location_col)[bill_col].sum().reset_index().sort_values(by=bill_col, ascending=False)
+    current_location_sales = filtered_bar_data.groupby(level=location_col, observed=True, sort=False).sum().reset_index().sort_values(by=bill_col, ascending=False)
+    current_location_sales = top_with_other(current_location_sales, location_col, bill_col)
 
     # Group for Category Plot
-    current_category_sales = filtered_bar_data.groupby(category_col)[bill_col].sum().reset_index().sort_values(by=bill_col, ascending=False)
+    current_category_sales = filtered_bar_data.groupby(level=category_col, observed=True, sort=False).sum().reset_index().sort_values(by=bill_col, ascending=False)
+    current_category_sales = top_with_other(current_category_sales, category_col, bill_col)
 
     # --- Create Plotly Charts ---
     # Plot 1: Daily Revenue Trend
+    # One trace per hour; the hour dropdown only toggles visibility client-side.
+    # The dropdown state never reaches Python, so changing the location or category
+    # filter rebuilds the figure and the shown hour returns to the default below
     fig1 = go.Figure()
+    hours = [int(hour) for hour in daily_sums['Hour'].unique()]
+    selected_hour = hours[0] if hours and 12 not in hours else 12
     
-    if not daily_sums.empty:
-        fig1.add_trace(go.Scatter(
-            x=daily_sums['transaction_date'],
-            y=daily_sums[bill_col],
+    for hour, hour_sums in daily_sums.groupby('Hour'):
+        fig1.add_trace(go.Scattergl(
+            x=hour_sums['transaction_date'].to_numpy(),
+            y=hour_sums[bill_col].to_numpy(dtype='float32'),
             mode='lines+markers',
             line=dict(color='#60A5FA', width=4),
             marker=dict(color='#60A5FA', size=8),
-            name='Daily Revenue'
+            name=f'Daily Revenue (Hour: {int(hour)})',
+            visible=int(hour) == selected_hour
         ))
     
+    if hours:
+        fig1.update_layout(updatemenus=[dict(
+            buttons=[
+                dict(
+                    label=f"⏰ Hour {hour}",
+                    method='update',
+                    args=[
+                        {'visible': [other == hour for other in hours]},
+                        {'title.text': f"📈 Daily Revenue Trend (Hour: {hour})"}
+                    ]
+                )
+                for hour in hours
+            ],
+            active=hours.index(selected_hour),
+            x=1, xanchor='right', y=1.15, yanchor='top',
+            bgcolor='#475569', bordercolor='#64748B', font=dict(color='#F1F5F9')
+        )])
+    
     fig1.update_layout(
-        title=f"📈 Daily Revenue Trend (Hour: {selected_hour})",
+        CHART_LAYOUT,
+        title_text=f"📈 Daily Revenue Trend (Hour: {selected_hour})",
+        showlegend=False,
         xaxis_title="Date",
         yaxis_title="Total Revenue ($)",
         height=400,
-        plot_bgcolor='#334155',
-        paper_bgcolor='#334155',
-        font=dict(color='#F1F5F9', size=12),
-        title_font=dict(size=18, color='#F1F5F9'),
-        xaxis=dict(gridcolor='#64748B'),
-        yaxis=dict(gridcolor='#64748B', tickformat='$,.0f')
+        title_font_size=18,
+        xaxis_gridcolor='#64748B'
     )
 
     # Plot 2: Sales by Store Location
@@ -249,24 +318,21 @@ if not data.empty:
     
     if not current_location_sales.empty:
         fig2.add_trace(go.Bar(
-            x=current_location_sales[location_col],
-            y=current_location_sales[bill_col],
+            x=current_location_sales[location_col].to_numpy(),
+            y=current_location_sales[bill_col].to_numpy(dtype='float32'),
             marker_color='#059669',
             marker_line=dict(color='white', width=2),
             name='Location Sales'
         ))
     
     fig2.update_layout(
-        title="🏪 Total Sales by Store Location",
+        CHART_LAYOUT,
+        title_text="🏪 Total Sales by Store Location",
         xaxis_title="Store Location",
         yaxis_title="Total Revenue ($)",
         height=350,
-        plot_bgcolor='#334155',
-        paper_bgcolor='#334155',
-        font=dict(color='#F1F5F9', size=12),
-        title_font=dict(size=16, color='#F1F5F9'),
-        xaxis=dict(tickangle=45),
-        yaxis=dict(gridcolor='#64748B', tickformat='$,.0f')
+        xaxis_type='category',
+        xaxis_tickangle=45
     )
 
     # Plot 3: Sales by Product Category
@@ -275,24 +341,21 @@ if not data.empty:
     if not current_category_sales.empty:
         colors = ["#1E40AF", "#DC2626", "#059669", "#D97706", "#7C3AED", "#BE185D", "#0891B2", "#65A30D"]
         fig3.add_trace(go.Bar(
-            x=current_category_sales[category_col],
-            y=current_category_sales[bill_col],
+            x=current_category_sales[category_col].to_numpy(),
+            y=current_category_sales[bill_col].to_numpy(dtype='float32'),
             marker_color=colors[:len(current_category_sales)],
             marker_line=dict(color='white', width=2),
             name='Category Sales'
         ))
     
     fig3.update_layout(
-        title="📦 Total Sales by Product Category",
+        CHART_LAYOUT,
+        title_text="📦 Total Sales by Product Category",
         xaxis_title="Product Category",
         yaxis_title="Total Revenue ($)",
         height=350,
-        plot_bgcolor='#334155',
-        paper_bgcolor='#334155',
-        font=dict(color='#F1F5F9', size=12),
-        title_font=dict(size=16, color='#F1F5F9'),
-        xaxis=dict(tickangle=45),
-        yaxis=dict(gridcolor='#64748B', tickformat='$,.0f')
+        xaxis_type='category',
+        xaxis_tickangle=45
     )
 
     # --- Display Plots in Streamlit ---
@@ -311,31 +374,109 @@ if not data.empty:
         st.plotly_chart(fig3, use_container_width=True)
         st.markdown('</div>', unsafe_allow_html=True)
 
+# File uploader
+uploaded_file = st.file_uploader(
+    "Upload your Coffee Shop Sales data",
+    type=['xlsx', 'csv'],
+    help="Upload an Excel file (.xlsx) or CSV file (.csv) containing coffee shop sales data"
+)
+
+# Load data if file is uploaded
+if uploaded_file is not None:
+    data = load_data(uploaded_file)
+else:
+    st.info("👆 Please upload a data file to get started")
+    data = pd.DataFrame()
+
+# Only proceed if data was loaded successfully and is not empty
+if not data.empty:
+    # Display first few rows to understand the data structure
+    with st.expander("📊 Data Preview", expanded=False):
+        st.write(data.head())
+    
+    # --- Data Preprocessing with better error handling ---
+    try:
+        # Find relevant columns
+        date_cols, time_cols, location_cols, category_cols, amount_cols = [], [], [], [], []
+        for col in data.columns:
+            lowered = col.lower()
+            if 'date' in lowered:
+                date_cols.append(col)
+            if 'time' in lowered:
+                time_cols.append(col)
+            if any(k in lowered for k in ('location', 'store')):
+                location_cols.append(col)
+            if any(k in lowered for k in ('category', 'product')):
+                category_cols.append(col)
+            if any(k in lowered for k in ('bill', 'total', 'amount', 'price')):
+                amount_cols.append(col)
+        
+        with st.expander("🔍 Column Detection", expanded=False):
+            st.write("Detected columns:")
+            st.write(f"📅 Date columns: {date_cols}")
+            st.write(f"⏰ Time columns: {time_cols}")
+            st.write(f"📍 Location columns: {location_cols}")
+            st.write(f"🏷️ Category columns: {category_cols}")
+            st.write(f"💰 Amount columns: {amount_cols}")
+        
+        # Use detected columns or fallback to defaults
+        date_col = date_cols[0] if date_cols else data.columns[0]
+        time_col = time_cols[0] if time_cols else (data.columns[1] if len(data.columns) > 1 else data.columns[0])
+        location_col = location_cols[0] if location_cols else (data.columns[2] if len(data.columns) > 2 else data.columns[0])
+        category_col = category_cols[0] if category_cols else (data.columns[3] if len(data.columns) > 3 else data.columns[0])
+        bill_col = amount_cols[0] if amount_cols else data.columns[-1]
+        
+        st.success(f"✅ Using columns - Date: **{date_col}**, Time: **{time_col}**, Location: **{location_col}**, Category: **{category_col}**, Amount: **{bill_col}**")
+        
+        data = preprocess(data, date_col, time_col, location_col, category_col, bill_col)
+
+    except Exception as e:
+        st.error(f"Error in data preprocessing: {e}")
+        with st.expander("🐛 Debug Information", expanded=True):
+            st.write("Data types:")
+            st.write(data.dtypes)
+            st.write("Sample of data:")
+            st.write(data.head())
+        st.stop()
+
+    # --- Interactive Dashboard ---
+    cube = build_cube(data, location_col, category_col, bill_col)
+    render_dashboard(data, cube, location_col, category_col, bill_col)
+
     # --- Display Summary Statistics ---
     st.markdown("---")
     st.subheader("📊 Summary Statistics")
+    stats = summary(data, bill_col)
     
     col1, col2, col3, col4 = st.columns(4)
     with col1:
         st.markdown('<div class="metric-container">', unsafe_allow_html=True)
-        st.metric("Total Revenue", f"${data[bill_col].sum():,.2f}")
+        st.metric("Total Revenue", f"${stats['total']:,.2f}")
         st.markdown('</div>', unsafe_allow_html=True)
     with col2:
         st.markdown('<div class="metric-container">', unsafe_allow_html=True)
-        st.metric("Total Transactions", len(data))
+        st.metric("Total Transactions", stats['count'])
         st.markdown('</div>', unsafe_allow_html=True)
     with col3:
         st.markdown('<div class="metric-container">', unsafe_allow_html=True)
-        st.metric("Average Transaction", f"${data[bill_col].mean():.2f}")
+        st.metric("Average Transaction", f"${stats['mean']:.2f}")
         st.markdown('</div>', unsafe_allow_html=True)
     with col4:
         st.markdown('<div class="metric-container">', unsafe_allow_html=True)
-        st.metric("Date Range", f"{data['transaction_date'].min().date()} to {data['transaction_date'].max().date()}")
+        st.metric("Date Range", f"{stats['dmin'].date()} to {stats['dmax'].date()}")
         st.markdown('</div>', unsafe_allow_html=True)
 
     st.markdown("---")
     st.subheader("📋 Explore Data Details")
-    st.dataframe(data, use_container_width=True)
+    # Only the first rows are sent to the browser; the full table is a download
+    st.caption(f"Showing the first {min(len(data), 1000):,} of {len(data):,} rows")
+    st.dataframe(data.head(1000), use_container_width=True)
+    st.download_button(
+        "⬇️ Download full CSV",
+        data=to_csv(data),
+        file_name="coffee_shop_sales.csv",
+        mime="text/csv"
+    )
 
 elif uploaded_file is not None:
     st.error("❌ No data available to display. Please check your uploaded file.")